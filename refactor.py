@@ -1,5 +1,5 @@
+import math
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Tuple
 
 
@@ -36,7 +36,7 @@ def initialize() -> Tuple[
 # Define the differential equation function
 def f1(
     t1: float, t2: float, w1: float, w2: float, c1: float, c2: float, g: float
-) -> np.ndarray:
+) -> Tuple[float, float, float, float]:
     """
     Calculates the derivatives for the differential equations.
 
@@ -50,26 +50,26 @@ def f1(
         g: Acceleration due to gravity.
 
     Returns:
-        Array of derivatives.
-    """
-    return np.array(
-        [
-            w1,
-            w2,
-            (
-                -3 * g * np.sin(t1)
-                - g * np.sin(t1 - 2 * t2)
-                - 2 * np.sin(t1 - t2) * (c2 * w2**2 + c1 * w1**2 * np.cos(t1 - t2))
-            )
-            / (c1 * (3 - np.cos(2 * t1 - 2 * t2))),
-            (
-                2
-                * np.sin(t1 - t2)
-                * (2 * c1 * w1**2 + 2 * g * np.cos(t1) + c2 * w2**2 * np.cos(t1 - t2))
-            )
-            / (c2 * (3 - np.cos(2 * t1 - 2 * t2))),
-        ]
+        Tuple of derivatives.
+    """
+    # Terms shared by both angular accelerations
+    s12 = math.sin(t1 - t2)
+    c12 = math.cos(t1 - t2)
+    # 3 - cos(2 * (t1 - t2)) == 2 + 2 * sin(t1 - t2) ** 2
+    denom = 2 + 2 * s12 * s12
+
+    a1 = (
+        -3 * g * math.sin(t1)
+        - g * math.sin(t1 - 2 * t2)
+        - 2 * s12 * (c2 * w2**2 + c1 * w1**2 * c12)
+    ) / (c1 * denom)
+    a2 = (
+        2
+        * s12
+        * (2 * c1 * w1**2 + 2 * g * math.cos(t1) + c2 * w2**2 * c12)
+        / (c2 * denom)
     )
+    return w1, w2, a1, a2
 
 
 # Runge-Kutta integration
@@ -100,34 +100,225 @@ def runge_kutta(
 
     Returns:
         Updated arrays for angles and angular velocities.
+
+    Raises:
+        OverflowError: If the solution blows up, typically because h is too
+            large. The arrays hold the steps computed before that point.
     """
-    for i in range(len(t) - 1):
-        # Update variables
-        k1 = f1(t1[i], t2[i], w1[i], w2[i])
-        k2 = f1(
-            t1[i] + k1[0] * h / 2,
-            t2[i] + k1[1] * h / 2,
-            w1[i] + k1[2] * h / 2,
-            w2[i] + k1[3] * h / 2,
-        )
-        k3 = f1(
-            t1[i] + k2[0] * h / 2,
-            t2[i] + k2[1] * h / 2,
-            w1[i] + k2[2] * h / 2,
-            w2[i] + k2[3] * h / 2,
-        )
-        k4 = f1(
-            t1[i] + k3[0] * h, t2[i] + k3[1] * h, w1[i] + k3[2] * h, w2[i] + k3[3] * h
-        )
+    # Carry the state in scalar locals instead of re-reading the arrays
+    y1, y2, v1, v2 = float(t1[0]), float(t2[0]), float(w1[0]), float(w2[0])
+    # Python floats raise instead of overflowing to inf once the step is too
+    # large for the dynamics, so report that as a divergence
+    try:
+        for i in range(len(t) - 1):
+            # Update variables
+            k1 = f1(y1, y2, v1, v2, c1, c2, g)
+            k2 = f1(
+                y1 + k1[0] * h / 2,
+                y2 + k1[1] * h / 2,
+                v1 + k1[2] * h / 2,
+                v2 + k1[3] * h / 2,
+                c1,
+                c2,
+                g,
+            )
+            k3 = f1(
+                y1 + k2[0] * h / 2,
+                y2 + k2[1] * h / 2,
+                v1 + k2[2] * h / 2,
+                v2 + k2[3] * h / 2,
+                c1,
+                c2,
+                g,
+            )
+            k4 = f1(
+                y1 + k3[0] * h,
+                y2 + k3[1] * h,
+                v1 + k3[2] * h,
+                v2 + k3[3] * h,
+                c1,
+                c2,
+                g,
+            )
 
-        # Update variables
-        t1[i + 1] = t1[i] + h / 6 * (k1[0] + 2 * k2[0] + 2 * k3[0] + k4[0])
-        t2[i + 1] = t2[i] + h / 6 * (k1[1] + 2 * k2[1] + 2 * k3[1] + k4[1])
-        w1[i + 1] = w1[i] + h / 6 * (k1[2] + 2 * k2[2] + 2 * k3[2] + k4[2])
-        w2[i + 1] = w2[i] + h / 6 * (k1[3] + 2 * k2[3] + 2 * k3[3] + k4[3])
+            # Update variables
+            y1 = y1 + h / 6 * (k1[0] + 2 * k2[0] + 2 * k3[0] + k4[0])
+            y2 = y2 + h / 6 * (k1[1] + 2 * k2[1] + 2 * k3[1] + k4[1])
+            v1 = v1 + h / 6 * (k1[2] + 2 * k2[2] + 2 * k3[2] + k4[2])
+            v2 = v2 + h / 6 * (k1[3] + 2 * k2[3] + 2 * k3[3] + k4[3])
+            t1[i + 1] = y1
+            t2[i + 1] = y2
+            w1[i + 1] = v1
+            w2[i + 1] = v2
+    except (OverflowError, ValueError) as err:
+        raise OverflowError(
+            f"Integration diverged at t = {t[i]}; try a smaller time step h."
+        ) from err
     return t1, t2, w1, w2
 
 
+# Batched derivative function
+def f1_batch(
+    y: np.ndarray, c1: float, c2: float, g: float, out: np.ndarray
+) -> np.ndarray:
+    """
+    Calculates the derivatives for many independent pendulums at once.
+
+    Args:
+        y: Array of shape (M, 4) with one (t1, t2, w1, w2) row per pendulum.
+        c1: Length of the first pendulum.
+        c2: Length of the second pendulum.
+        g: Acceleration due to gravity.
+        out: Array of shape (M, 4) the derivatives are written into.
+
+    Returns:
+        The out array.
+
+    Raises:
+        ValueError: If y or out is not of shape (M, 4).
+    """
+    if np.ndim(y) != 2 or np.shape(y)[1] != 4 or np.shape(out) != np.shape(y):
+        raise ValueError(
+            f"y and out must both have shape (M, 4), got {np.shape(y)} and "
+            f"{np.shape(out)}"
+        )
+    t1, t2, w1, w2 = y.T
+    s12 = np.sin(t1 - t2)
+    c12 = np.cos(t1 - t2)
+    # 3 - cos(2 * (t1 - t2)) == 2 + 2 * sin(t1 - t2) ** 2
+    denom = 2 + 2 * s12 * s12
+
+    out[:, 0] = w1
+    out[:, 1] = w2
+    out[:, 2] = (
+        -3 * g * np.sin(t1)
+        - g * np.sin(t1 - 2 * t2)
+        - 2 * s12 * (c2 * w2**2 + c1 * w1**2 * c12)
+    ) / (c1 * denom)
+    out[:, 3] = (
+        2
+        * s12
+        * (2 * c1 * w1**2 + 2 * g * np.cos(t1) + c2 * w2**2 * c12)
+        / (c2 * denom)
+    )
+    return out
+
+
+# Batched Runge-Kutta integration
+def runge_kutta_batch(
+    c1: float, c2: float, g: float, y0: np.ndarray, h: float, n: int
+) -> np.ndarray:
+    """
+    Performs Runge-Kutta integration for many independent pendulums at once.
+
+    Args:
+        c1: Length of the first pendulum.
+        c2: Length of the second pendulum.
+        g: Acceleration due to gravity.
+        y0: Array of shape (M, 4) with the initial (t1, t2, w1, w2) of each
+            pendulum.
+        h: Time step.
+        n: Number of time points, including the initial one.
+
+    Returns:
+        Array of shape (n, M, 4) with the state of every pendulum at every
+        time point.
+
+    Raises:
+        ValueError: If y0 is not of shape (M, 4) or n is less than 1.
+    """
+    if np.ndim(y0) != 2 or np.shape(y0)[1] != 4:
+        raise ValueError(f"y0 must have shape (M, 4), got {np.shape(y0)}")
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+
+    y = np.empty((n,) + np.shape(y0))
+    y[0] = y0
+
+    # Stage buffers, reused every step
+    k1 = np.empty_like(y[0])
+    k2 = np.empty_like(y[0])
+    k3 = np.empty_like(y[0])
+    k4 = np.empty_like(y[0])
+    tmp = np.empty_like(y[0])
+
+    for i in range(n - 1):
+        f1_batch(y[i], c1, c2, g, k1)
+        np.multiply(k1, h / 2, out=tmp)
+        tmp += y[i]
+        f1_batch(tmp, c1, c2, g, k2)
+        np.multiply(k2, h / 2, out=tmp)
+        tmp += y[i]
+        f1_batch(tmp, c1, c2, g, k3)
+        np.multiply(k3, h, out=tmp)
+        tmp += y[i]
+        f1_batch(tmp, c1, c2, g, k4)
+
+        # Update variables, accumulating in tmp in the same order as runge_kutta
+        np.multiply(k2, 2, out=tmp)
+        tmp += k1
+        k3 *= 2
+        tmp += k3
+        tmp += k4
+        tmp *= h / 6
+        np.add(y[i], tmp, out=y[i + 1])
+    return y
+
+
+# Adaptive integration
+def solve_adaptive(
+    c1: float,
+    c2: float,
+    g: float,
+    y0: np.ndarray,
+    t_max: float,
+    n_samples: int = 1000,
+    rtol: float = 1e-9,
+    atol: float = 1e-12,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Solves the differential equations with SciPy's adaptive DOP853 integrator.
+
+    Args:
+        c1: Length of the first pendulum.
+        c2: Length of the second pendulum.
+        g: Acceleration due to gravity.
+        y0: Initial angles and angular velocities (t1, t2, w1, w2).
+        t_max: End time of the simulation.
+        n_samples: Number of evenly spaced output time points.
+        rtol: Relative tolerance of the integrator.
+        atol: Absolute tolerance of the integrator.
+
+    Returns:
+        Array of time points and arrays for angles and angular velocities.
+
+    Raises:
+        ValueError: If t_max is not positive or n_samples is less than 1.
+        RuntimeError: If the integrator stops before reaching t_max.
+    """
+    from scipy.integrate import solve_ivp
+
+    if t_max <= 0:
+        raise ValueError(f"t_max must be positive, got {t_max}")
+    if n_samples < 1:
+        raise ValueError(f"n_samples must be at least 1, got {n_samples}")
+
+    t = np.linspace(0, t_max, n_samples)
+    sol = solve_ivp(
+        lambda _, y: f1(y[0], y[1], y[2], y[3], c1, c2, g),
+        (0, t_max),
+        y0,
+        method="DOP853",
+        t_eval=t,
+        rtol=rtol,
+        atol=atol,
+    )
+    if not sol.success:
+        raise RuntimeError(sol.message)
+    t1, t2, w1, w2 = sol.y
+    return t, t1, t2, w1, w2
+
+
 # Calculate positions and energy
 def calculate_positions_energy(
     c1: float,
@@ -164,16 +355,21 @@ def calculate_positions_energy(
         E: Array of energy values.
         t: Array of time points.
     """
-    for i in range(len(t) - 1):
-        mx1[i] = c1 * np.sin(t1[i]) + c2 * np.sin(t2[i])
-        my1[i] = -c1 * np.cos(t1[i]) - c2 * np.cos(t2[i])
-        mx2[i] = c1 * np.sin(t1[i]) + c2 * np.sin(t2[i])
-        my2[i] = -c1 * np.cos(t1[i]) - c2 * np.cos(t2[i])
-        E[i] = 0.5 * m * (
-            2 * c1**2 * w1[i] ** 2
-            + c2**2 * w2[i] ** 2
-            + 2 * c1 * c2 * w1[i] * w2[i] * np.cos(t1[i] - t2[i])
-        ) - m * g * (2 * c1 * np.cos(t1[i]) + c2 * np.cos(t2[i]))
+    # Evaluate every sample at once, including the last one
+    n = len(t)
+    t1, t2, w1, w2 = t1[:n], t2[:n], w1[:n], w2[:n]
+    # One sin/cos per angle, shared by positions and energy
+    s1, co1 = np.sin(t1), np.cos(t1)
+    s2, co2 = np.sin(t2), np.cos(t2)
+    mx1[:] = c1 * s1
+    my1[:] = -c1 * co1
+    mx2[:] = mx1 + c2 * s2
+    my2[:] = my1 - c2 * co2
+    E[:] = 0.5 * m * (
+        2 * c1**2 * w1**2
+        + c2**2 * w2**2
+        + 2 * c1 * c2 * w1 * w2 * (co1 * co2 + s1 * s2)
+    ) - m * g * (2 * c1 * co1 + c2 * co2)
 
     return mx1, my1, mx2, my2
 
@@ -198,6 +394,9 @@ def plot_results(
         my2: Array of y-positions for the second pendulum.
         E: Array of energy values.
     """
+    # Imported here so the numerical functions don't pay for matplotlib
+    import matplotlib.pyplot as plt
+
     # Plotting
     fig, axs = plt.subplots(2, 2)
 
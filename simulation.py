@@ -1,3 +1,4 @@
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -12,37 +13,97 @@ g = 9.8
 
 
 # Eval function
-def f1(t1, t2, w1, w2):
-    return np.array(
-        [
-            w1,
-            w2,
-            (
-                -3 * g * np.sin(t1)
-                - g * np.sin(t1 - 2 * t2)
-                - 2 * np.sin(t1 - t2) * (c2 * w2**2 + c1 * w1**2 * np.cos(t1 - t2))
+def f1(t1, t2, w1, w2, c1, c2, g):
+    # Terms shared by both angular accelerations
+    s12 = math.sin(t1 - t2)
+    c12 = math.cos(t1 - t2)
+    # 3 - cos(2 * (t1 - t2)) == 2 + 2 * sin(t1 - t2) ** 2
+    denom = 2 + 2 * s12 * s12
+
+    a1 = (
+        -3 * g * math.sin(t1)
+        - g * math.sin(t1 - 2 * t2)
+        - 2 * s12 * (c2 * w2**2 + c1 * w1**2 * c12)
+    ) / (c1 * denom)
+    a2 = (
+        2
+        * s12
+        * (2 * c1 * w1**2 + 2 * g * math.cos(t1) + c2 * w2**2 * c12)
+        / (c2 * denom)
+    )
+    return w1, w2, a1, a2
+
+
+# Runge-Kutta integration, positions and energy in a single pass
+def integrate(state, mx1, my1, mx2, my2, E, h, n, c1, c2, m, g):
+    # Carry the state in scalar locals instead of re-reading the array
+    y1, y2, v1, v2 = state[0].tolist()
+    # Python floats raise instead of overflowing to inf if the run blows up
+    try:
+        for i in range(n):
+            # Calculate positions and energy from one sin/cos per angle
+            s1, co1 = math.sin(y1), math.cos(y1)
+            s2, co2 = math.sin(y2), math.cos(y2)
+            x1 = c1 * s1
+            z1 = -c1 * co1
+            mx1[i] = x1
+            my1[i] = z1
+            mx2[i] = x1 + c2 * s2
+            my2[i] = z1 - c2 * co2
+            E[i] = 0.5 * m * (
+                2 * c1**2 * v1**2
+                + c2**2 * v2**2
+                + 2 * c1 * c2 * v1 * v2 * (co1 * co2 + s1 * s2)
+            ) - m * g * (2 * c1 * co1 + c2 * co2)
+
+            # The last sample has no step after it
+            if i == n - 1:
+                break
+
+            # Update variables
+            k1 = f1(y1, y2, v1, v2, c1, c2, g)
+            k2 = f1(
+                y1 + k1[0] * h / 2,
+                y2 + k1[1] * h / 2,
+                v1 + k1[2] * h / 2,
+                v2 + k1[3] * h / 2,
+                c1,
+                c2,
+                g,
             )
-            / (c1 * (3 - np.cos(2 * t1 - 2 * t2))),
-            (
-                2
-                * np.sin(t1 - t2)
-                * (2 * c1 * w1**2 + 2 * g * np.cos(t1) + c2 * w2**2 * np.cos(t1 - t2))
+            k3 = f1(
+                y1 + k2[0] * h / 2,
+                y2 + k2[1] * h / 2,
+                v1 + k2[2] * h / 2,
+                v2 + k2[3] * h / 2,
+                c1,
+                c2,
+                g,
+            )
+            k4 = f1(
+                y1 + k3[0] * h,
+                y2 + k3[1] * h,
+                v1 + k3[2] * h,
+                v2 + k3[3] * h,
+                c1,
+                c2,
+                g,
             )
-            / (c2 * (3 - np.cos(2 * t1 - 2 * t2))),
-        ]
-    )
 
+            y1 = y1 + h / 6 * (k1[0] + 2 * k2[0] + 2 * k3[0] + k4[0])
+            y2 = y2 + h / 6 * (k1[1] + 2 * k2[1] + 2 * k3[1] + k4[1])
+            v1 = v1 + h / 6 * (k1[2] + 2 * k2[2] + 2 * k3[2] + k4[2])
+            v2 = v2 + h / 6 * (k1[3] + 2 * k2[3] + 2 * k3[3] + k4[3])
+            state[i + 1] = y1, y2, v1, v2
+    except (OverflowError, ValueError) as err:
+        raise OverflowError(
+            f"Integration diverged at t = {i * h}; try a smaller time step h."
+        ) from err
 
-# Initial conditions
-t1 = np.zeros(10001)
-t2 = np.zeros(10001)
-w1 = np.zeros(10001)
-w2 = np.zeros(10001)
 
-t1[0] = -np.pi / 3
-t2[0] = -5 * np.pi / 6
-w1[0] = 0.00
-w2[0] = 0
+# Initial conditions, one (t1, t2, w1, w2) row per time step
+state = np.zeros((10001, 4))
+state[0] = -np.pi / 3, -5 * np.pi / 6, 0.00, 0
 
 h = 0.001
 t = np.arange(0, 10, h)
@@ -55,59 +116,28 @@ my2 = np.zeros(len(t))
 E = np.zeros(len(t))
 
 # Runge-Kutta loop
-for i in range(len(t) - 1):
-    # Update variables
-    k1 = f1(t1[i], t2[i], w1[i], w2[i])
-    k2 = f1(
-        t1[i] + k1[0] * h / 2,
-        t2[i] + k1[1] * h / 2,
-        w1[i] + k1[2] * h / 2,
-        w2[i] + k1[3] * h / 2,
-    )
-    k3 = f1(
-        t1[i] + k2[0] * h / 2,
-        t2[i] + k2[1] * h / 2,
-        w1[i] + k2[2] * h / 2,
-        w2[i] + k2[3] * h / 2,
-    )
-    k4 = f1(t1[i] + k3[0] * h, t2[i] + k3[1] * h, w1[i] + k3[2] * h, w2[i] + k3[3] * h)
-
-    # Update variables
-    t1[i + 1] = t1[i] + h / 6 * (k1[0] + 2 * k2[0] + 2 * k3[0] + k4[0])
-    t2[i + 1] = t2[i] + h / 6 * (k1[1] + 2 * k2[1] + 2 * k3[1] + k4[1])
-    w1[i + 1] = w1[i] + h / 6 * (k1[2] + 2 * k2[2] + 2 * k3[2] + k4[2])
-    w2[i + 1] = w2[i] + h / 6 * (k1[3] + 2 * k2[3] + 2 * k3[3] + k4[3])
-
-    # Calculate positions and energy
-    mx1[i] = c1 * np.sin(t1[i]) + c2 * np.sin(t2[i])
-    my1[i] = -c1 * np.cos(t1[i]) - c2 * np.cos(t2[i])
-    mx2[i] = c1 * np.sin(t1[i]) + c2 * np.sin(t2[i])
-    my2[i] = -c1 * np.cos(t1[i]) - c2 * np.cos(t2[i])
-    E[i] = 0.5 * m * (
-        2 * c1**2 * w1[i] ** 2
-        + c2**2 * w2[i] ** 2
-        + 2 * c1 * c2 * w1[i] * w2[i] * np.cos(t1[i] - t2[i])
-    ) - m * g * (2 * c1 * np.cos(t1[i]) + c2 * np.cos(t2[i]))
-
-# Plotting
+integrate(state, mx1, my1, mx2, my2, E, h, len(t), c1, c2, m, g)
+
+# Plotting, every 10th sample is plenty for the figure resolution
+plot_step = 10
 fig, axs = plt.subplots(2, 2)
 
-axs[0, 0].plot(t, mx1)
+axs[0, 0].plot(t[::plot_step], mx1[::plot_step])
 axs[0, 0].set_title("X-Position 1")
 axs[0, 0].set_xlabel("Time")
 axs[0, 0].set_ylabel("Position")
 
-axs[0, 1].plot(t, my1)
+axs[0, 1].plot(t[::plot_step], my1[::plot_step])
 axs[0, 1].set_title("Y-Position 1")
 axs[0, 1].set_xlabel("Time")
 axs[0, 1].set_ylabel("Position")
 
-axs[1, 0].plot(t, mx2)
+axs[1, 0].plot(t[::plot_step], mx2[::plot_step])
 axs[1, 0].set_title("X-Position 2")
 axs[1, 0].set_xlabel("Time")
 axs[1, 0].set_ylabel("Position")
 
-axs[1, 1].plot(t, my2)
+axs[1, 1].plot(t[::plot_step], my2[::plot_step])
 axs[1, 1].set_title("Y-Position 2")
 axs[1, 1].set_xlabel("Time")
 axs[1, 1].set_ylabel("Position")
@@ -115,7 +145,7 @@ axs[1, 1].set_ylabel("Position")
 plt.tight_layout()
 plt.show()
 
-plt.plot(t, E)
+plt.plot(t[::plot_step], E[::plot_step])
 plt.title("Energy")
 plt.xlabel("Time")
 plt.ylabel("Energy")
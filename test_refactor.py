@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import refactor
+
+# Constants used by both simulation scripts
+C1 = 1.0
+C2 = 0.5
+M = 1
+G = 9.8
+H = 0.001
+
+
+def test_batch_of_one_matches_runge_kutta():
+    n = 1000
+    t = np.arange(n) * H
+    t1, t2, w1, w2 = (np.zeros(n) for _ in range(4))
+    t1[0] = -np.pi / 3
+    t2[0] = -5 * np.pi / 6
+    refactor.runge_kutta(C1, C2, G, t1, t2, w1, w2, H, t)
+
+    y = refactor.runge_kutta_batch(C1, C2, G, [[t1[0], t2[0], 0.0, 0.0]], H, n)
+
+    np.testing.assert_array_equal(y[:, 0], np.column_stack([t1, t2, w1, w2]))
+
+
+def test_batch_energy_drift_is_bounded():
+    n = 2000
+    t = np.arange(n) * H
+    rng = np.random.default_rng(0)
+    y0 = np.zeros((64, 4))
+    y0[:, :2] = rng.uniform(-np.pi, np.pi, (64, 2))
+
+    y = refactor.runge_kutta_batch(C1, C2, G, y0, H, n)
+
+    mx1, my1, mx2, my2, E = (np.zeros(n) for _ in range(5))
+    for j in range(len(y0)):
+        t1, t2, w1, w2 = y[:, j].T
+        refactor.calculate_positions_energy(
+            C1, C2, M, G, t1, t2, w1, w2, mx1, my1, mx2, my2, E, t
+        )
+        assert np.max(np.abs(E - E[0])) < 1e-5
+
+
+@pytest.mark.parametrize(
+    "y0, n",
+    [(np.zeros(4), 10), (np.zeros((2, 3)), 10), (np.zeros((2, 4)), 0)],
+)
+def test_batch_rejects_bad_input(y0, n):
+    with pytest.raises(ValueError):
+        refactor.runge_kutta_batch(C1, C2, G, y0, H, n)